@@ -1,10 +1,12 @@
+import math
 from typing import Dict
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.models.blast import Blast, Hole
-from app.services.analytics import compute_powder_factor, summarize_burden_spacing
+from app.services.analytics import compute_powder_factor, summarize_blast
+from app.services.prediction import MAX_VIBRATION_POINTS, predict_fragmentation, predict_vibration
 
 router = APIRouter()
 
@@ -15,13 +17,7 @@ def analysis_summary(blast_id: int, db: Session = Depends(get_db)) -> Dict:
 	if not blast:
 		raise HTTPException(status_code=404, detail="Blast not found")
 
-	burdens = [h.burden for h in blast.holes]
-	spacings = [h.spacing for h in blast.holes]
-	return {
-		"burden": summarize_burden_spacing(burdens),
-		"spacing": summarize_burden_spacing(spacings),
-		"holes": len(blast.holes),
-	}
+	return summarize_blast(blast.holes)
 
 
 @router.get("/{blast_id}/powder-factor")
@@ -59,3 +55,55 @@ def analysis_powder_factor(
 	if not results:
 		return {"avg_powder_factor": 0.0}
 	return {"avg_powder_factor": sum(results) / len(results)}
+
+
+@router.get("/{blast_id}/fragmentation")
+def analysis_fragmentation(
+	blast_id: int,
+	bench_height_m: float = 10.0,
+	rock_factor: float = 7.0,
+	rws: float = 100.0,
+	drill_deviation_m: float = 0.0,
+	db: Session = Depends(get_db),
+):
+	if not all(math.isfinite(v) and v > 0 for v in (bench_height_m, rock_factor, rws)):
+		raise HTTPException(status_code=400, detail="bench_height_m, rock_factor and rws must be positive")
+	if not (math.isfinite(drill_deviation_m) and drill_deviation_m >= 0):
+		raise HTTPException(status_code=400, detail="drill_deviation_m must be zero or positive")
+
+	blast = db.query(Blast).filter(Blast.id == blast_id).first()
+	if not blast:
+		raise HTTPException(status_code=404, detail="Blast not found")
+	return predict_fragmentation(
+		blast.holes,
+		bench_height_m=bench_height_m,
+		rock_factor=rock_factor,
+		rws=rws,
+		drill_deviation_m=drill_deviation_m,
+	)
+
+
+@router.get("/{blast_id}/vibration")
+def analysis_vibration(
+	blast_id: int,
+	points: str,
+	site_k: float = 1140.0,
+	site_beta: float = 1.6,
+	db: Session = Depends(get_db),
+):
+	# Monitoring points are given as comma-separated distances in metres, e.g. ?points=100,250,500
+	try:
+		distances = [float(p) for p in points.split(",") if p.strip()]
+	except ValueError:
+		raise HTTPException(status_code=400, detail="points must be comma-separated distances in metres")
+	if not distances or not all(math.isfinite(d) and d > 0 for d in distances):
+		raise HTTPException(status_code=400, detail="points must be positive distances in metres")
+	if len(distances) > MAX_VIBRATION_POINTS:
+		raise HTTPException(status_code=400, detail=f"at most {MAX_VIBRATION_POINTS} points are allowed")
+	if not all(math.isfinite(v) and v > 0 for v in (site_k, site_beta)):
+		raise HTTPException(status_code=400, detail="site_k and site_beta must be positive")
+
+	blast = db.query(Blast).filter(Blast.id == blast_id).first()
+	if not blast:
+		raise HTTPException(status_code=404, detail="Blast not found")
+	return predict_vibration(blast.holes, distances, site_k=site_k, site_beta=site_beta)
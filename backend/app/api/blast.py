@@ -5,6 +5,8 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models.blast import Blast, Hole
 from app.schemas.blast import BlastCreate, BlastOut
+from app.services.analytics import summarize_blast
+from app.services.events import broker
 
 router = APIRouter()
 
@@ -30,6 +32,8 @@ def create_blast(payload: BlastCreate, db: Session = Depends(get_db)):
 			db.add(hole)
 	db.commit()
 	db.refresh(blast)
+	if broker.has_subscribers:
+		broker.publish("blast.created", {"blast_id": blast.id, "summary": summarize_blast(blast.holes)})
 	return blast
 
 
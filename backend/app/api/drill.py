@@ -1,26 +1,40 @@
 from typing import List
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.models.drill import DrillPlan
-from app.schemas.drill import DrillPlanCreate, DrillPlanOut
+from app.schemas.drill import DrillPlanCreate, DrillPlanOut, DrillOptimizeRequest, DrillPlanCandidate
+from app.services.events import broker
+from app.services.optimizer import (
+	MAX_GEOJSON_FEATURES,
+	MAX_GRID_HOLES,
+	MAX_LATTICE_SIZE,
+	lattice_size,
+	max_grid_holes,
+	search_grids,
+	unit_powder_factor,
+)
 import json
 
 router = APIRouter()
 
 
+def _grid_feature(r: int, c: int, x: float, y: float):
+	return {
+		"type": "Feature",
+		"properties": {"row": r, "col": c, "name": f"H{r+1}-{c+1}"},
+		"geometry": {"type": "Point", "coordinates": [x, y]},
+	}
+
+
 def _generate_grid_geojson(origin_x: float, origin_y: float, rows: int, cols: int, burden: float, spacing: float):
 	features = []
 	for r in range(rows):
 		for c in range(cols):
 			x = origin_x + c * spacing
 			y = origin_y + r * burden
-			features.append({
-				"type": "Feature",
-				"properties": {"row": r, "col": c, "name": f"H{r+1}-{c+1}"},
-				"geometry": {"type": "Point", "coordinates": [x, y]},
-			})
+			features.append(_grid_feature(r, c, x, y))
 	return {"type": "FeatureCollection", "features": features}
 
 
@@ -50,6 +64,7 @@ def create_plan(payload: DrillPlanCreate, db: Session = Depends(get_db)):
 	db.add(plan)
 	db.commit()
 	db.refresh(plan)
+	broker.publish("plan.created", {"plan_id": plan.id, "name": plan.name, "holes": len(geojson["features"])})
 	return plan
 
 
@@ -63,3 +78,51 @@ def list_plans(db: Session = Depends(get_db)):
 			except Exception:
 				pass
 	return plans
+
+
+@router.post("/optimize", response_model=List[DrillPlanCandidate])
+def optimize_plan(payload: DrillOptimizeRequest):
+	# Input ranges are validated by DrillOptimizeRequest; these checks bound the work per request
+	if lattice_size(payload.burden_min, payload.burden_max, payload.step, payload.spacing_ratio_max) > MAX_LATTICE_SIZE:
+		raise HTTPException(status_code=400, detail=f"search lattice exceeds {MAX_LATTICE_SIZE} candidates; increase step or narrow the range")
+	unit_pf = unit_powder_factor(
+		hole_diameter_mm=payload.hole_diameter_mm,
+		bench_height_m=payload.bench_height_m,
+		charge_length_m=payload.charge_length_m,
+		explosive_density_kg_m3=payload.explosive_density_kg_m3,
+		rock_density_t_m3=payload.rock_density_t_m3,
+	)
+	grid_holes = max_grid_holes(
+		polygon=payload.polygon,
+		unit_pf=unit_pf,
+		target_powder_factor=payload.target_powder_factor,
+		tolerance=payload.tolerance,
+		burden_min=payload.burden_min,
+		spacing_ratio_min=payload.spacing_ratio_min,
+	)
+	if grid_holes > MAX_GRID_HOLES:
+		raise HTTPException(status_code=400, detail=f"candidate grids could reach {grid_holes} holes (limit {MAX_GRID_HOLES}); raise burden_min or split the bench")
+	if payload.include_geojson and grid_holes * payload.top_n > MAX_GEOJSON_FEATURES:
+		raise HTTPException(status_code=400, detail=f"GeoJSON for {payload.top_n} plans could exceed {MAX_GEOJSON_FEATURES} features; lower top_n or omit include_geojson")
+
+	candidates = search_grids(
+		polygon=payload.polygon,
+		unit_pf=unit_pf,
+		target_powder_factor=payload.target_powder_factor,
+		burden_min=payload.burden_min,
+		burden_max=payload.burden_max,
+		step=payload.step,
+		spacing_ratio_min=payload.spacing_ratio_min,
+		spacing_ratio_max=payload.spacing_ratio_max,
+		tolerance=payload.tolerance,
+		top_n=payload.top_n,
+	)
+	plans = []
+	for c in candidates:
+		hole_rc, hole_xy = c.pop("hole_rc"), c.pop("hole_xy")
+		if payload.include_geojson:
+			# Build features only for the holes that survived clipping
+			features = [_grid_feature(r, col, x, y) for (r, col), (x, y) in zip(hole_rc.tolist(), hole_xy.tolist())]
+			c["grid_geojson"] = {"type": "FeatureCollection", "features": features}
+		plans.append(DrillPlanCandidate(**c))
+	return plans
@@ -0,0 +1,37 @@
+import asyncio
+
+from fastapi import APIRouter, Request
+from fastapi.responses import StreamingResponse
+
+from app.services.events import broker
+
+router = APIRouter()
+
+KEEPALIVE_SECONDS = 15.0
+
+
+@router.get("/stream")
+async def stream_events(request: Request):
+	queue = broker.subscribe()
+
+	async def event_source():
+		try:
+			while True:
+				if await request.is_disconnected():
+					break
+				try:
+					message = await asyncio.wait_for(queue.get(), timeout=KEEPALIVE_SECONDS)
+				except asyncio.TimeoutError:
+					# SSE comment line keeps proxies from closing idle connections
+					message = ": keepalive\n\n"
+				if message is None:
+					break
+				yield message
+		finally:
+			broker.unsubscribe(queue)
+
+	return StreamingResponse(
+		event_source(),
+		media_type="text/event-stream",
+		headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+	)
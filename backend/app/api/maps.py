@@ -5,6 +5,7 @@ from sqlalchemy.orm import Session
 from app.db.session import get_db
 from app.models.map import MapLayer
 from app.schemas.map import MapLayerCreate, MapLayerOut
+from app.services.events import broker
 import json
 
 router = APIRouter()
@@ -16,6 +17,7 @@ def create_layer(payload: MapLayerCreate, db: Session = Depends(get_db)):
 	db.add(layer)
 	db.commit()
 	db.refresh(layer)
+	broker.publish("layer.created", {"layer_id": layer.id, "name": layer.name, "layer_type": layer.layer_type})
 	return layer
 
 
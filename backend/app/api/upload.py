@@ -7,6 +7,8 @@ from sqlalchemy.orm import Session
 
 from app.db.session import get_db
 from app.models.blast import Blast, Hole
+from app.services.analytics import summarize_blast
+from app.services.events import broker
 
 router = APIRouter()
 
@@ -44,6 +46,8 @@ async def upload_csv(
 
 	db.commit()
 	db.refresh(blast)
+	if broker.has_subscribers:
+		broker.publish("blast.created", {"blast_id": blast.id, "summary": summarize_blast(blast.holes)})
 	return {"id": blast.id}
 
 
@@ -15,6 +15,9 @@ class Settings(BaseSettings):
 	jwt_algorithm: str = Field(default="HS256")
 	access_token_expire_minutes: int = Field(default=60 * 24)
 
+	# Max pending realtime events per SSE client before oldest are dropped
+	event_queue_size: int = Field(default=100)
+
 	cors_allow_origins: List[str] = Field(
 		default_factory=lambda: [
 			"http://localhost",
@@ -1,12 +1,20 @@
-from fastapi import FastAPI
+import asyncio
+import math
+
+from fastapi import FastAPI, Request
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 
 from app.core.config import settings
 from app.api import auth, analysis, blast, upload
 from app.api import maps as maps_api
 from app.api import drill as drill_api
+from app.api import events as events_api
 from app.db.base import Base
 from app.db.session import engine
+from app.services.events import broker
 
 # Ensure models are imported so that Base.metadata is aware of them
 from app.models import user as user_model  # noqa: F401
@@ -25,18 +33,42 @@ app.add_middleware(
 )
 
 
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(request: Request, exc: RequestValidationError):
+	# NaN/Infinity inputs are rejected by validation but can't be echoed back as strict JSON
+	errors = []
+	for error in exc.errors():
+		value = error.get("input")
+		if isinstance(value, float) and not math.isfinite(value):
+			error = {k: v for k, v in error.items() if k != "input"}
+		errors.append(error)
+	return JSONResponse(status_code=422, content={"detail": jsonable_encoder(errors)})
+
+
 @app.on_event("startup")
 def on_startup() -> None:
 	# Create tables if they don't exist (simple bootstrap without migrations)
 	Base.metadata.create_all(bind=engine)
 
 
+@app.on_event("startup")
+async def bind_event_broker() -> None:
+	# Sync route handlers publish from worker threads onto this loop
+	broker.bind_loop(asyncio.get_running_loop())
+
+
+@app.on_event("shutdown")
+def close_event_broker() -> None:
+	broker.close()
+
+
 app.include_router(auth.router, prefix="/auth", tags=["auth"])
 app.include_router(upload.router, prefix="/upload", tags=["upload"])
 app.include_router(blast.router, prefix="/blasts", tags=["blasts"])
 app.include_router(analysis.router, prefix="/analysis", tags=["analysis"])
 app.include_router(maps_api.router, prefix="/maps", tags=["maps"])
 app.include_router(drill_api.router, prefix="/drill", tags=["drill"])
+app.include_router(events_api.router, prefix="/events", tags=["events"])
 
 
 @app.get("/")
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
-from typing import Optional, Any
+from pydantic import BaseModel, Field, conlist, model_validator
+from typing import Optional, Any, List
+
+from app.services.optimizer import MAX_CLIPPED_CANDIDATES
 
 
 class DrillPlanBase(BaseModel):
@@ -24,3 +26,54 @@ class DrillPlanOut(DrillPlanBase):
 
 	class Config:
 		from_attributes = True
+
+
+class DrillOptimizeRequest(BaseModel):
+	target_powder_factor: float = Field(gt=0)
+	polygon: List[conlist(float, min_length=2, max_length=2)] = Field(min_length=3)
+	hole_diameter_mm: float = Field(gt=0)
+	bench_height_m: float = Field(default=10.0, gt=0)
+	subdrill_m: float = Field(default=0.0, ge=0)
+	stemming_m: float = Field(default=2.0, ge=0)
+	explosive_density_kg_m3: float = Field(default=850.0, gt=0)
+	rock_density_t_m3: float = Field(default=2.7, gt=0)
+	burden_min: float = Field(default=1.0, gt=0)
+	burden_max: float = Field(default=10.0, gt=0)
+	# Lattice values are rounded to millimetres, so finer steps would only repeat candidates
+	step: float = Field(default=0.05, ge=0.001)
+	spacing_ratio_min: float = Field(default=1.0, gt=0)
+	spacing_ratio_max: float = Field(default=1.5, gt=0)
+	# Max relative deviation from the target powder factor, e.g. 0.1 = within 10%
+	tolerance: float = Field(default=0.1, gt=0)
+	top_n: int = Field(default=5, ge=1, le=MAX_CLIPPED_CANDIDATES)
+	include_geojson: bool = False
+
+	class Config:
+		allow_inf_nan = False
+
+	@property
+	def charge_length_m(self) -> float:
+		return self.bench_height_m + self.subdrill_m - self.stemming_m
+
+	@model_validator(mode="after")
+	def check_ranges(self):
+		if self.burden_max < self.burden_min:
+			raise ValueError("burden_max must not be less than burden_min")
+		if self.spacing_ratio_max < self.spacing_ratio_min:
+			raise ValueError("spacing_ratio_max must not be less than spacing_ratio_min")
+		if self.charge_length_m <= 0:
+			raise ValueError("stemming leaves no room for an explosive column")
+		return self
+
+
+class DrillPlanCandidate(BaseModel):
+	burden: float
+	spacing: float
+	rows: int
+	cols: int
+	origin_x: float
+	origin_y: float
+	powder_factor: float
+	deviation: float
+	holes: int
+	grid_geojson: Optional[Any] = None
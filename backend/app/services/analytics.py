@@ -23,3 +23,11 @@ def summarize_burden_spacing(values: List[float]) -> Dict[str, float]:
 		"max": max(filtered),
 		"avg": sum(filtered) / len(filtered),
 	}
+
+
+def summarize_blast(holes: List) -> Dict:
+	return {
+		"burden": summarize_burden_spacing([h.burden for h in holes]),
+		"spacing": summarize_burden_spacing([h.spacing for h in holes]),
+		"holes": len(holes),
+	}
@@ -0,0 +1,73 @@
+import asyncio
+import json
+from typing import Dict, Optional, Set
+
+from app.core.config import settings
+
+
+class EventBroker:
+	"""In-process pub/sub that fans change events out to SSE subscribers."""
+
+	def __init__(self, queue_size: int = 100) -> None:
+		self.queue_size = queue_size
+		self._subscribers: Set[asyncio.Queue] = set()
+		self._loop: Optional[asyncio.AbstractEventLoop] = None
+		self._closed = False
+
+	@property
+	def has_subscribers(self) -> bool:
+		return bool(self._subscribers)
+
+	def bind_loop(self, loop: asyncio.AbstractEventLoop) -> None:
+		# Called on every app startup, so a broker closed by an earlier shutdown is reopened
+		self._loop = loop
+		self._closed = False
+
+	def subscribe(self) -> asyncio.Queue:
+		queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+		if self._closed:
+			queue.put_nowait(None)
+		else:
+			self._subscribers.add(queue)
+		return queue
+
+	def unsubscribe(self, queue: asyncio.Queue) -> None:
+		self._subscribers.discard(queue)
+
+	def publish(self, event_type: str, data: Dict) -> None:
+		# Sync endpoints run in the threadpool, so hand off to the event loop
+		if self._loop is None or not self._subscribers:
+			return
+		# Serialize once and share the frame across all subscribers
+		message = f"event: {event_type}\ndata: {json.dumps(data, separators=(',', ':'))}\n\n"
+		try:
+			running = asyncio.get_running_loop()
+		except RuntimeError:
+			running = None
+		if running is self._loop:
+			self._fan_out(message)
+		else:
+			self._loop.call_soon_threadsafe(self._fan_out, message)
+
+	def close(self) -> None:
+		# Safe to call from another thread
+		if self._loop is None or self._closed:
+			return
+		self._closed = True
+		self._loop.call_soon_threadsafe(self._fan_out, None)
+
+	def _fan_out(self, message: Optional[str]) -> None:
+		for queue in list(self._subscribers):
+			if queue.full():
+				# Slow client: drop its oldest pending event instead of blocking writers
+				try:
+					queue.get_nowait()
+				except asyncio.QueueEmpty:
+					pass
+			queue.put_nowait(message)
+		if message is None:
+			# Closing sentinel: every stream returns once it reads this
+			self._subscribers.clear()
+
+
+broker = EventBroker(queue_size=settings.event_queue_size)
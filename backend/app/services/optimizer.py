@@ -0,0 +1,152 @@
+import math
+from typing import Dict, List
+
+import numpy as np
+
+from app.services.analytics import compute_powder_factor
+
+
+# Upper bounds that keep a single request's memory and runtime interactive
+MAX_LATTICE_SIZE = 1_000_000
+MAX_CLIPPED_CANDIDATES = 50
+MAX_GRID_HOLES = 500_000
+MAX_GEOJSON_FEATURES = 250_000
+_CHUNK_ELEMENTS = 1 << 20
+
+
+def lattice_size(burden_min: float, burden_max: float, step: float, spacing_ratio_max: float) -> int:
+	burden_steps = math.ceil((burden_max - burden_min) / step) + 1
+	spacing_steps = math.ceil((burden_max * spacing_ratio_max - burden_min) / step) + 1
+	return burden_steps * max(spacing_steps, 1)
+
+
+def unit_powder_factor(
+	hole_diameter_mm: float,
+	bench_height_m: float,
+	charge_length_m: float,
+	explosive_density_kg_m3: float,
+	rock_density_t_m3: float,
+) -> float:
+	# Powder factor scales with 1 / (B * S), so a 1 m x 1 m pattern covers every candidate
+	return compute_powder_factor(
+		rock_density_t_m3=rock_density_t_m3,
+		explosive_density_kg_m3=explosive_density_kg_m3,
+		explosive_column_m=charge_length_m,
+		hole_diameter_mm=hole_diameter_mm,
+		burden_m=1.0,
+		spacing_m=1.0,
+		bench_height_m=bench_height_m,
+	)
+
+
+def max_grid_holes(
+	polygon: List[List[float]],
+	unit_pf: float,
+	target_powder_factor: float,
+	tolerance: float,
+	burden_min: float,
+	spacing_ratio_min: float,
+) -> int:
+	# Largest rows * cols any clipped candidate can have over the polygon's bounding box
+	poly = np.asarray(polygon, dtype=float)
+	width, height = (poly.max(axis=0) - poly.min(axis=0)).tolist()
+	spacing_min = burden_min * max(spacing_ratio_min, 1.0)
+	rows_max = height / burden_min + 1.0
+	cols_max = width / spacing_min + 1.0
+	# Candidates within tolerance also can't have a pattern smaller than this area
+	area_min = max(burden_min * spacing_min, unit_pf / (target_powder_factor * (1.0 + tolerance)))
+	by_area = width * height / area_min + rows_max + cols_max
+	return math.ceil(min(rows_max * cols_max, by_area))
+
+
+def grid_in_polygon(
+	polygon: np.ndarray,
+	origin_x: float,
+	origin_y: float,
+	rows: int,
+	cols: int,
+	burden: float,
+	spacing: float,
+) -> np.ndarray:
+	# Even-odd scanline test: each grid row crosses the polygon edges at the same x values,
+	# so the edges are intersected once per row rather than once per hole
+	xi, yi = polygon[:, 0], polygon[:, 1]
+	xj, yj = np.roll(xi, 1), np.roll(yi, 1)
+	with np.errstate(divide="ignore", invalid="ignore"):
+		slope = (xj - xi) / (yj - yi)
+	xs = origin_x + np.arange(cols) * spacing
+	inside = np.zeros((rows, cols), dtype=bool)
+	chunk = max(_CHUNK_ELEMENTS // len(polygon), 1)
+	for start in range(0, rows, chunk):
+		ys = origin_y + np.arange(start, min(start + chunk, rows))[:, np.newaxis] * burden
+		straddles = (yi > ys) != (yj > ys)
+		with np.errstate(invalid="ignore"):
+			x_cross = np.sort(np.where(straddles, slope * (ys - yi) + xi, np.inf), axis=1)
+		n_cross = straddles.sum(axis=1)
+		for offset, (crossings, n) in enumerate(zip(x_cross, n_cross)):
+			if n:
+				right = n - np.searchsorted(crossings[:n], xs, side="right")
+				inside[start + offset] = right % 2 == 1
+	return inside.ravel()
+
+
+def search_grids(
+	polygon: List[List[float]],
+	unit_pf: float,
+	target_powder_factor: float,
+	burden_min: float,
+	burden_max: float,
+	step: float,
+	spacing_ratio_min: float,
+	spacing_ratio_max: float,
+	tolerance: float,
+	top_n: int,
+) -> List[Dict]:
+	poly = np.asarray(polygon, dtype=float)
+	min_x, min_y = poly.min(axis=0)
+	width, height = poly.max(axis=0) - poly.min(axis=0)
+
+	# Every burden/spacing pair on the search lattice within the allowed S/B ratio
+	burden_values = np.unique(np.arange(burden_min, burden_max + step / 2.0, step).round(3))
+	spacing_values = np.unique(np.arange(burden_min, burden_max * spacing_ratio_max + step / 2.0, step).round(3))
+	burdens, spacings = np.meshgrid(burden_values, spacing_values)
+	burdens, spacings = burdens.ravel(), spacings.ravel()
+	ratio = spacings / burdens
+	keep = (ratio >= spacing_ratio_min) & (ratio <= spacing_ratio_max)
+	burdens, spacings = burdens[keep], spacings[keep]
+
+	powder_factors = unit_pf / (burdens * spacings)
+	deviations = (powder_factors - target_powder_factor) / target_powder_factor
+	# Only candidates within tolerance are worth clipping, best first
+	within = np.flatnonzero(np.abs(deviations) <= tolerance)
+	order = within[np.argsort(np.abs(deviations[within]), kind="stable")][:MAX_CLIPPED_CANDIDATES]
+
+	results: List[Dict] = []
+	for idx in order:
+		burden, spacing = float(burdens[idx]), float(spacings[idx])
+		rows = int(height // burden) + 1
+		cols = int(width // spacing) + 1
+		# Centre the grid on the polygon's bounding box
+		origin_x = float(min_x + (width - (cols - 1) * spacing) / 2.0)
+		origin_y = float(min_y + (height - (rows - 1) * burden) / 2.0)
+		inside = grid_in_polygon(poly, origin_x, origin_y, rows, cols, burden, spacing)
+		if not inside.any():
+			continue
+		# Row-major, matching the grid generator's hole order
+		r, c = np.divmod(np.flatnonzero(inside), cols)
+		results.append({
+			"burden": burden,
+			"spacing": spacing,
+			"rows": rows,
+			"cols": cols,
+			"origin_x": origin_x,
+			"origin_y": origin_y,
+			"powder_factor": float(powder_factors[idx]),
+			"deviation": float(deviations[idx]),
+			"holes": int(r.size),
+			"hole_rc": np.column_stack([r, c]),
+			"hole_xy": np.column_stack([origin_x + c * spacing, origin_y + r * burden]),
+		})
+		if len(results) >= top_n:
+			break
+	return results
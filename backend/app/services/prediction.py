@@ -0,0 +1,107 @@
+from typing import Dict, List
+
+import numpy as np
+
+from app.services.analytics import summarize_burden_spacing
+
+
+# Keeps a single vibration request bounded
+MAX_VIBRATION_POINTS = 1000
+
+
+def _hole_arrays(holes: List) -> Dict[str, np.ndarray]:
+	# Missing values become NaN so incomplete holes can be masked out in one pass
+	def column(attr: str) -> np.ndarray:
+		return np.array([getattr(h, attr) for h in holes], dtype=float)
+
+	return {
+		"burden": column("burden"),
+		"spacing": column("spacing"),
+		"diameter_mm": column("diameter_mm"),
+		"charge_m": column("explosive_column_m"),
+		"density": column("explosive_density_kg_m3"),
+	}
+
+
+def _charge_mass_kg(diameter_mm: np.ndarray, charge_m: np.ndarray, density: np.ndarray) -> np.ndarray:
+	hole_radius_m = (diameter_mm / 1000.0) / 2.0
+	return density * np.pi * hole_radius_m ** 2 * charge_m
+
+
+def predict_fragmentation(
+	holes: List,
+	bench_height_m: float = 10.0,
+	rock_factor: float = 7.0,
+	rws: float = 100.0,
+	drill_deviation_m: float = 0.0,
+) -> Dict:
+	a = _hole_arrays(holes)
+	complete = np.all([np.isfinite(v) & (v > 0) for v in a.values()], axis=0)
+	# Cunningham's index is only defined while both of its correction terms stay positive
+	with np.errstate(invalid="ignore"):
+		valid = complete & (a["burden"] > drill_deviation_m) & (14.0 * a["burden"] / a["diameter_mm"] < 2.2)
+	b, s, d, l = a["burden"][valid], a["spacing"][valid], a["diameter_mm"][valid], a["charge_m"][valid]
+	q = _charge_mass_kg(d, l, a["density"][valid])
+	with np.errstate(over="ignore", divide="ignore", invalid="ignore"):
+		k = q / (b * s * bench_height_m)
+
+		# Kuznetsov mean fragment size in cm, with Cunningham's explosive strength term
+		x50 = rock_factor * k ** -0.8 * q ** (1.0 / 6.0) * (115.0 / rws) ** (19.0 / 20.0)
+		# Cunningham uniformity index
+		n = (
+			(2.2 - 14.0 * b / d)
+			* np.sqrt((1.0 + s / b) / 2.0)
+			* (1.0 - drill_deviation_m / b)
+			* (l / bench_height_m)
+		)
+		# Rosin-Rammler characteristic size and 80% passing size
+		xc = x50 / np.log(2.0) ** (1.0 / n)
+		x80 = xc * np.log(5.0) ** (1.0 / n)
+
+	# Near-zero uniformity or extreme inputs overflow; those holes are excluded too
+	finite = np.isfinite(k) & np.isfinite(x50) & np.isfinite(n) & np.isfinite(x80)
+	k, x50, n, x80 = k[finite], x50[finite], n[finite], x80[finite]
+	valid[valid] = finite
+
+	hole_ids = [h.hole_id for h, ok in zip(holes, valid) if ok]
+	per_hole = [
+		{"hole_id": hid, "powder_factor": pf, "x50_cm": m, "x80_cm": p80, "uniformity": u}
+		for hid, pf, m, p80, u in zip(hole_ids, k.tolist(), x50.tolist(), x80.tolist(), n.tolist())
+	]
+	return {
+		"holes": int(valid.sum()),
+		"excluded": int((complete & ~valid).sum()),
+		"x50_cm": summarize_burden_spacing(x50.tolist()),
+		"x80_cm": summarize_burden_spacing(x80.tolist()),
+		"uniformity": summarize_burden_spacing(n.tolist()),
+		"per_hole": per_hole,
+	}
+
+
+def predict_vibration(
+	holes: List,
+	distances_m: List[float],
+	site_k: float = 1140.0,
+	site_beta: float = 1.6,
+) -> Dict:
+	a = _hole_arrays(holes)
+	q = _charge_mass_kg(a["diameter_mm"], a["charge_m"], a["density"])
+	q = q[np.isfinite(q) & (q > 0)]
+	if q.size == 0 or not distances_m:
+		return {"holes": int(q.size), "excluded": 0, "points": []}
+
+	# Holes carry no coordinates, so every hole sits at the same distance from a point and
+	# the heaviest charge per delay (one hole per delay) always governs the peak PPV
+	dist = np.asarray(distances_m, dtype=float)
+	with np.errstate(over="ignore", divide="ignore"):
+		scaled = dist / np.sqrt(q.max())
+		ppv = site_k * scaled ** -site_beta
+	ok = np.isfinite(scaled) & np.isfinite(ppv)
+	return {
+		"holes": int(q.size),
+		"excluded": int((~ok).sum()),
+		"points": [
+			{"distance_m": dm, "scaled_distance": sd, "max_ppv_mm_s": p}
+			for dm, sd, p in zip(dist[ok].tolist(), scaled[ok].tolist(), ppv[ok].tolist())
+		],
+	}
@@ -0,0 +1,45 @@
+import threading
+import time
+
+import pytest
+import uvicorn
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import app.db.session as db_session
+import app.main as main
+
+
+@pytest.fixture
+def db_engine(tmp_path, monkeypatch):
+	# Point the app at a throwaway SQLite file instead of backend/mine_blast.db
+	engine = create_engine(f"sqlite:///{tmp_path / 'test.db'}", connect_args={"check_same_thread": False})
+	monkeypatch.setattr(main, "engine", engine)
+	monkeypatch.setattr(db_session, "SessionLocal", sessionmaker(autocommit=False, autoflush=False, bind=engine))
+	yield engine
+	engine.dispose()
+
+
+@pytest.fixture
+def client(db_engine):
+	with TestClient(main.app) as c:
+		yield c
+
+
+@pytest.fixture
+def live_server(db_engine):
+	# TestClient buffers whole responses, so streaming endpoints need a real server
+	config = uvicorn.Config(main.app, host="127.0.0.1", port=0, log_level="warning", timeout_graceful_shutdown=1)
+	server = uvicorn.Server(config)
+	thread = threading.Thread(target=server.run, daemon=True)
+	thread.start()
+	deadline = time.time() + 10
+	while not server.started:
+		if time.time() > deadline:
+			raise RuntimeError("server did not start")
+		time.sleep(0.02)
+	port = server.servers[0].sockets[0].getsockname()[1]
+	yield f"http://127.0.0.1:{port}"
+	server.should_exit = True
+	thread.join(timeout=10)
@@ -0,0 +1,56 @@
+import asyncio
+import json
+
+import httpx
+
+from app.services.events import EventBroker
+
+
+def _read_event(response, event_type):
+	lines = response.iter_lines()
+	for line in lines:
+		if line == f"event: {event_type}":
+			return json.loads(next(lines)[len("data: "):])
+	raise AssertionError(f"stream ended before {event_type}")
+
+
+def test_subscriber_receives_blast_created(live_server):
+	with httpx.stream("GET", f"{live_server}/events/stream", timeout=10) as stream:
+		assert stream.headers["content-type"].startswith("text/event-stream")
+		created = httpx.post(
+			f"{live_server}/blasts/",
+			json={"name": "B1", "holes": [{"hole_id": "A1", "burden": 3.0, "spacing": 4.0}, {"hole_id": "A2", "burden": 3.5, "spacing": 4.0}]},
+		).json()
+		event = _read_event(stream, "blast.created")
+
+	assert event["blast_id"] == created["id"]
+	assert event["summary"]["holes"] == 2
+	assert event["summary"]["burden"] == {"min": 3.0, "max": 3.5, "avg": 3.25}
+
+
+def test_slow_subscriber_drops_oldest_event():
+	async def scenario():
+		broker = EventBroker(queue_size=2)
+		broker.bind_loop(asyncio.get_running_loop())
+		queue = broker.subscribe()
+		for i in range(3):
+			broker.publish("tick", {"i": i})
+		return [queue.get_nowait() for _ in range(queue.qsize())]
+
+	assert asyncio.run(scenario()) == ['event: tick\ndata: {"i":1}\n\n', 'event: tick\ndata: {"i":2}\n\n']
+
+
+def test_close_ends_streams_and_rebind_reopens():
+	async def scenario():
+		broker = EventBroker()
+		broker.bind_loop(asyncio.get_running_loop())
+		queue = broker.subscribe()
+		broker.close()
+		await asyncio.sleep(0)
+		closed = await queue.get()
+		# A later startup in the same process accepts subscribers again
+		broker.bind_loop(asyncio.get_running_loop())
+		reopened = broker.subscribe()
+		return closed, broker.has_subscribers, reopened.empty()
+
+	assert asyncio.run(scenario()) == (None, True, True)
@@ -0,0 +1,73 @@
+import numpy as np
+import pytest
+
+from app.services.optimizer import grid_in_polygon, search_grids, unit_powder_factor
+
+
+TRIANGLE = [[0.0, 0.0], [200.0, 0.0], [0.0, 150.0]]
+
+
+def _inside_triangle(x, y):
+	# Holes landing exactly on the bench limit count as inside
+	return x >= 0 and y >= 0 and x / 200.0 + y / 150.0 <= 1.0
+
+
+def _unit_pf():
+	return unit_powder_factor(
+		hole_diameter_mm=165.0,
+		bench_height_m=10.0,
+		charge_length_m=8.0,
+		explosive_density_kg_m3=850.0,
+		rock_density_t_m3=2.7,
+	)
+
+
+def test_grid_in_polygon_matches_point_test():
+	rows, cols, burden, spacing = 31, 41, 5.0, 5.0
+	inside = grid_in_polygon(np.array(TRIANGLE), 0.5, 0.5, rows, cols, burden, spacing)
+	expected = [_inside_triangle(0.5 + c * spacing, 0.5 + r * burden) for r in range(rows) for c in range(cols)]
+	assert inside.tolist() == expected
+
+
+def test_candidates_within_tolerance_and_clipped():
+	plans = search_grids(
+		polygon=TRIANGLE,
+		unit_pf=_unit_pf(),
+		target_powder_factor=0.6,
+		burden_min=2.0,
+		burden_max=8.0,
+		step=0.05,
+		spacing_ratio_min=1.0,
+		spacing_ratio_max=1.5,
+		tolerance=0.05,
+		top_n=5,
+	)
+
+	assert len(plans) == 5
+	assert len({(p["burden"], p["spacing"]) for p in plans}) == 5
+	for plan in plans:
+		assert abs(plan["deviation"]) <= 0.05
+		assert plan["powder_factor"] == pytest.approx(_unit_pf() / (plan["burden"] * plan["spacing"]))
+		assert plan["holes"] == len(plan["hole_xy"]) > 0
+		assert all(_inside_triangle(x, y) for x, y in plan["hole_xy"].tolist())
+
+
+def test_optimize_endpoint(client):
+	body = {"target_powder_factor": 0.6, "polygon": TRIANGLE, "hole_diameter_mm": 165, "top_n": 2, "include_geojson": True}
+	plans = client.post("/drill/optimize", json=body).json()
+
+	assert len(plans) == 2
+	features = plans[0]["grid_geojson"]["features"]
+	assert len(features) == plans[0]["holes"]
+	assert all(_inside_triangle(*f["geometry"]["coordinates"]) for f in features)
+
+
+def test_optimize_rejects_oversized_requests(client):
+	base = {"target_powder_factor": 0.6, "polygon": TRIANGLE, "hole_diameter_mm": 165}
+	huge_bench = [[0, 0], [10000, 0], [10000, 10000], [0, 10000]]
+
+	assert client.post("/drill/optimize", json={**base, "polygon": huge_bench}).status_code == 400
+	assert client.post("/drill/optimize", json={**base, "burden_max": 20, "step": 0.005}).status_code == 400
+	assert client.post("/drill/optimize", json={**base, "step": 0.0002}).status_code == 422
+	assert client.post("/drill/optimize", json={**base, "hole_diameter_mm": 0}).status_code == 422
+	assert client.post("/drill/optimize", json={**base, "spacing_ratio_min": 1.5, "spacing_ratio_max": 1.0}).status_code == 422
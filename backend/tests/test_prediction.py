@@ -0,0 +1,71 @@
+from types import SimpleNamespace
+
+import pytest
+
+from app.services.prediction import predict_fragmentation, predict_vibration
+
+
+def _hole(hole_id="A1", burden=3.5, spacing=4.0, diameter_mm=165.0, explosive_column_m=8.0, explosive_density_kg_m3=850.0):
+	return SimpleNamespace(
+		hole_id=hole_id,
+		burden=burden,
+		spacing=spacing,
+		diameter_mm=diameter_mm,
+		explosive_column_m=explosive_column_m,
+		explosive_density_kg_m3=explosive_density_kg_m3,
+	)
+
+
+# 165 mm hole, 8 m of 850 kg/m3 explosive: Q = 145.40 kg, K = Q / (3.5 * 4.0 * 10) = 1.0386 kg/m3
+REFERENCE_CHARGE_KG = 145.4007619897696
+
+
+def test_kuz_ram_reference_hole():
+	result = predict_fragmentation([_hole()], bench_height_m=10.0, rock_factor=7.0, rws=100.0)
+
+	hole = result["per_hole"][0]
+	assert hole["powder_factor"] == pytest.approx(1.038576871355497)
+	# X50 = A * K^-0.8 * Q^(1/6) * (115 / RWS)^(19/20)
+	assert hole["x50_cm"] == pytest.approx(17.784344042654453)
+	# n = (2.2 - 14 B/d) * sqrt((1 + S/B) / 2) * (1 - W/B) * (L/H)
+	assert hole["uniformity"] == pytest.approx(1.5758588046072672)
+	assert hole["x80_cm"] == pytest.approx(30.352620557857165)
+
+
+def test_fragmentation_excludes_holes_outside_model_range():
+	holes = [
+		_hole("ok"),
+		_hole("incomplete", burden=None),
+		_hole("deviation", burden=3.0),
+		# n collapses towards zero, so X80 overflows
+		_hole("overflow", burden=16.02, spacing=18.0, diameter_mm=102.0, explosive_column_m=0.5),
+	]
+	result = predict_fragmentation(holes, drill_deviation_m=3.2)
+
+	assert [h["hole_id"] for h in result["per_hole"]] == ["ok"]
+	assert result["holes"] == 1
+	assert result["excluded"] == 2
+
+
+def test_ppv_at_known_scaled_distance():
+	# The heaviest charge governs, so place the point at scaled distance 10 from it
+	holes = [_hole("small", explosive_column_m=4.0), _hole("large")]
+	distance = 10.0 * REFERENCE_CHARGE_KG ** 0.5
+	result = predict_vibration(holes, [distance, 1e-300], site_k=1140.0, site_beta=1.6)
+
+	assert result["holes"] == 2
+	assert result["excluded"] == 1
+	point = result["points"][0]
+	assert point["scaled_distance"] == pytest.approx(10.0)
+	assert point["max_ppv_mm_s"] == pytest.approx(1140.0 * 10.0 ** -1.6)
+
+
+def test_analysis_endpoints_validate_parameters(client):
+	blast_id = client.post("/blasts/", json={"name": "B1", "holes": [_hole().__dict__]}).json()["id"]
+
+	assert client.get(f"/analysis/{blast_id}/fragmentation").json()["holes"] == 1
+	assert client.get(f"/analysis/{blast_id}/fragmentation?rws=0").status_code == 400
+	assert client.get(f"/analysis/{blast_id}/vibration?points=nan").status_code == 400
+	assert client.get(f"/analysis/{blast_id}/vibration?points=100&site_beta=0").status_code == 400
+	too_many = ",".join(["100"] * 1001)
+	assert client.get(f"/analysis/{blast_id}/vibration?points={too_many}").status_code == 400